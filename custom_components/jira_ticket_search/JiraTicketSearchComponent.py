@@ -1,11 +1,122 @@
-from typing import Any, Sequence, Dict, Optional, List
-import requests
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import cached_property, partial
+from typing import Any, Callable, Hashable, Sequence, Dict, Optional, List, Tuple
+import httpx
+import orjson
+from cachetools import TTLCache
 from langchain_core.tools import Tool
 from loguru import logger
 
 from langflow.base.langchain_utilities.model import LCToolComponent
 from langflow.inputs import MessageTextInput, SecretStrInput, DropdownInput, IntInput, BoolInput
 
+# Fields read by _process_ticket; anything else Jira would return is dead weight.
+_DEFAULT_FIELDS = ["summary", "description", "status", "priority", "assignee", "reporter", "created", "updated"]
+
+# Largest page /search/jql returns when issue fields are requested.
+_SEARCH_PAGE_SIZE = 100
+
+# Sent with every Jira request through the shared client.
+_BASE_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json"
+}
+
+# 30 s for reads/writes, 3 s to establish a connection.
+_REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=3.0)
+
+# Responses worth retrying (rate limiting and transient server errors).
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+# Longest a single request may spend waiting between retries, in seconds.
+_RETRY_DEADLINE = 30.0
+
+# Bound str.format of the JQL each single-value search builds; values are
+# passed through _jql_quote first, so templates hold no quotes of their own.
+_JQL_TEMPLATES = {
+    "text": "text ~ {v}".format,
+    "key": "key = {v}".format,
+    "assignee": "assignee = {v}".format,
+    "reporter": "reporter = {v}".format,
+    "status": "status = {v}".format,
+}
+
+# (search type, tool name, tool description) for every tool build_tool can create
+_TOOL_SPECS = [
+    (
+        "jql",
+        "Jira_Search_JQL",
+        "Search Jira tickets using JQL (Jira Query Language). Input should be a valid JQL query string.",
+    ),
+    (
+        "text",
+        "Jira_Search_Text",
+        "Search Jira tickets containing specific text. Input should be the text to search for.",
+    ),
+    (
+        "key",
+        "Jira_Search_Key",
+        "Search for a specific Jira ticket by its key (e.g., PROJECT-123). "
+        "Several keys can be given separated by commas (e.g., PROJECT-123, PROJECT-124).",
+    ),
+    (
+        "specific_id",
+        "Jira_Search_Specific_ID",
+        "Search for a specific Jira ticket by its ID (e.g., OAPI-10686). "
+        "Several IDs can be given separated by commas (e.g., OAPI-10686, OAPI-10687).",
+    ),
+    (
+        "assignee",
+        "Jira_Search_Assignee",
+        "Search Jira tickets assigned to a specific user. Input should be the username or email.",
+    ),
+    (
+        "reporter",
+        "Jira_Search_Reporter",
+        "Search Jira tickets reported by a specific user. Input should be the username or email.",
+    ),
+    (
+        "status",
+        "Jira_Search_Status",
+        "Search Jira tickets with a specific status. Input should be the status name (e.g., 'In Progress', 'Done').",
+    ),
+]
+
+
+class JiraAPIError(ValueError):
+    """A Jira API request that did not succeed, with the HTTP status it returned."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessedTicket:
+    """The parts of a Jira ticket that the search tools report.
+
+    Immutable, since the same instances are handed out from the caches.
+    """
+
+    key: Optional[str]
+    summary: Optional[str]
+    status: Optional[str]
+    priority: Optional[str]
+    assignee: str
+    reporter: str
+    created: Optional[str]
+    updated: Optional[str]
+    url: str
+    description: Optional[str] = None
+    comments: Tuple[Dict, ...] = ()
+    attachments: Tuple[Dict, ...] = ()
+
 
 class JiraSearchTicketComponent(LCToolComponent):
     display_name: str = "Jira Search Tickets"
@@ -14,6 +125,14 @@ class JiraSearchTicketComponent(LCToolComponent):
     icon = "Jira"
     documentation: str = "https://docs.langflow.org"
 
+    _executor: Optional[ThreadPoolExecutor] = None
+    _client: Optional[httpx.Client] = None
+    _ticket_cache: Optional[TTLCache] = None
+    _jql_cache: Optional[TTLCache] = None
+    _cache_lock = threading.Lock()
+    # Guards lazy creation of the shared caches, worker pool and HTTP client
+    _init_lock = threading.Lock()
+
     inputs = [
         MessageTextInput(
             name="jira_instance",
@@ -62,107 +181,369 @@ class JiraSearchTicketComponent(LCToolComponent):
         ),
     ]
 
-    def _search_by_jql(self, jql_query: str) -> List[Dict]:
+    def _search_by_jql(self, jql_query: str, max_results: Optional[int] = None) -> List[ProcessedTicket]:
         """Search tickets using JQL (Jira Query Language)."""
-        url = f"{self.jira_instance}/rest/api/2/search"
-        params = {
+        if max_results is None:
+            max_results = self.max_results
+
+        jql_cache = self._get_jql_cache()
+        cache_key = (jql_query, max_results, self.include_comments, self.include_attachments)
+        cached = self._cache_get(jql_cache, cache_key)
+        if cached is not None:
+            return list(cached)
+
+        url = self._search_url
+        body = {
             "jql": jql_query,
-            "maxResults": self.max_results
+            "fields": self._get_search_fields()
         }
-        response = self._make_request(url, params=params)
-        return self._process_search_results(response.get("issues", []))
 
-    def _search_by_text(self, text: str) -> List[Dict]:
+        # Pages can only be walked in order via nextPageToken, so overlap the
+        # work instead: tickets of one page are processed on the pool while
+        # the next page is being fetched.
+        executor = self._get_executor()
+        pending = []
+        try:
+            while len(pending) < max_results:
+                body["maxResults"] = min(_SEARCH_PAGE_SIZE, max_results - len(pending))
+                response = self._make_request_post(url, body)
+                page = response.get("issues", [])
+                pending.extend(executor.submit(self._process_ticket, issue) for issue in page)
+
+                next_page_token = response.get("nextPageToken")
+                if not page or not next_page_token or response.get("isLast"):
+                    break
+                body["nextPageToken"] = next_page_token
+
+            results = [future.result() for future in pending]
+        except Exception:
+            # Nobody will wait for these any more; don't let them keep
+            # calling Jira or hold workers other searches need
+            for future in pending:
+                future.cancel()
+            raise
+        # Keep our own list so callers can't reorder or trim later hits
+        self._cache_set(jql_cache, cache_key, list(results))
+        return results
+
+    def _search_by_text(self, text: str) -> List[ProcessedTicket]:
         """Search tickets containing specific text."""
-        jql_query = f'text ~ "{text}"'
+        jql_query = _JQL_TEMPLATES["text"](v=self._jql_quote(text))
         return self._search_by_jql(jql_query)
 
-    def _search_by_key(self, key: str) -> List[Dict]:
-        """Search for a specific ticket by its key."""
-        # Clean up the key to handle potential formatting issues
-        key = key.strip().upper()
+    def _search_by_key(self, key: str) -> List[ProcessedTicket]:
+        """Search for a specific ticket by its key or ID like OAPI-10686, or several comma-separated keys."""
+        # Clean up the keys to handle potential formatting issues
+        keys = [k.strip().upper() for k in key.split(",") if k.strip()]
+        if len(keys) > 1:
+            return self._search_by_keys(keys)
+        key = keys[0] if keys else ""
+
+        ticket_cache = self._get_ticket_cache()
+        cache_key = (key, self.include_comments, self.include_attachments)
+        cached = self._cache_get(ticket_cache, cache_key)
+        if cached is not None:
+            return [cached]
 
         # First try direct ticket lookup
-        url = f"{self.jira_instance}/rest/api/2/issue/{key}"
+        url = f"{self._api_base}/issue/{key}"
         try:
             response = self._make_request(url)
-            return [self._process_ticket(response)]
+            processed_ticket = self._process_ticket(response)
+            self._cache_set(ticket_cache, cache_key, processed_ticket)
+            return [processed_ticket]
         except Exception as e:
             logger.warning(f"Direct ticket lookup failed: {e}")
             # Fall back to JQL search
-            jql_query = f'key = "{key}"'
+            jql_query = _JQL_TEMPLATES["key"](v=self._jql_quote(key))
             return self._search_by_jql(jql_query)
 
-    def _search_by_specific_id(self, ticket_id: str) -> List[Dict]:
-        """Search for a specific ticket by ID like OAPI-10686."""
-        # Ensure the ticket ID is properly formatted
-        ticket_id = ticket_id.strip().upper()
-
-        # Get the ticket directly by its key
-        return self._search_by_key(ticket_id)
-
-    def _search_by_assignee(self, assignee: str) -> List[Dict]:
+    def _search_by_keys(self, keys: List[str]) -> List[ProcessedTicket]:
+        """Search for several tickets by key, batching the uncached ones into a single JQL request."""
+        ticket_cache = self._get_ticket_cache()
+        flags = (self.include_comments, self.include_attachments)
+
+        found = {}
+        for key in keys:
+            cached = self._cache_get(ticket_cache, (key, *flags))
+            if cached is not None:
+                found[key] = cached
+        misses = [key for key in dict.fromkeys(keys) if key not in found]
+
+        fetched = []
+        last_error = None
+        if misses:
+            jql_query = f"issuekey in ({', '.join(self._jql_quote(key) for key in misses)})"
+            try:
+                fetched = self._search_by_jql(jql_query, max_results=len(misses))
+            except JiraAPIError as e:
+                # Jira rejects the whole query with a 400 if any one key is unknown
+                # or hidden; anything else (auth, outage) is a real failure
+                if e.status_code != 400:
+                    raise
+                logger.warning(f"Batched ticket lookup failed, looking keys up one by one: {e}")
+                for key in misses:
+                    try:
+                        fetched.extend(self._search_by_key(key))
+                    except JiraAPIError as key_error:
+                        if key_error.status_code not in (400, 404):
+                            raise
+                        logger.warning(f"Ticket lookup failed for {key}: {key_error}")
+                        last_error = key_error
+
+        extra = []
+        missed = set(misses)
+        for ticket in fetched:
+            if ticket.key in missed:
+                found[ticket.key] = ticket
+                self._cache_set(ticket_cache, (ticket.key, *flags), ticket)
+            else:
+                # e.g. a moved ticket answering to its old key
+                extra.append(ticket)
+
+        if not found and not extra and last_error is not None:
+            raise last_error
+
+        # Jira returns the batch in its own order; report tickets in the order asked for
+        return [found[key] for key in keys if key in found] + extra
+
+    def _search_by_assignee(self, assignee: str) -> List[ProcessedTicket]:
         """Search tickets assigned to a specific user."""
-        jql_query = f'assignee = "{assignee}"'
+        jql_query = _JQL_TEMPLATES["assignee"](v=self._jql_quote(assignee))
         return self._search_by_jql(jql_query)
 
-    def _search_by_reporter(self, reporter: str) -> List[Dict]:
+    def _search_by_reporter(self, reporter: str) -> List[ProcessedTicket]:
         """Search tickets reported by a specific user."""
-        jql_query = f'reporter = "{reporter}"'
+        jql_query = _JQL_TEMPLATES["reporter"](v=self._jql_quote(reporter))
         return self._search_by_jql(jql_query)
 
-    def _search_by_status(self, status: str) -> List[Dict]:
+    def _search_by_status(self, status: str) -> List[ProcessedTicket]:
         """Search tickets with a specific status."""
-        jql_query = f'status = "{status}"'
+        jql_query = _JQL_TEMPLATES["status"](v=self._jql_quote(status))
         return self._search_by_jql(jql_query)
 
+    def _jql_quote(self, value: str) -> str:
+        """Quote a user-supplied value as a JQL string literal.
+
+        Whitespace is normalized so equivalent inputs produce the same query
+        (and hit the same caches), and quotes/backslashes are escaped so the
+        value cannot break out of the literal.
+        """
+        value = " ".join(value.split())
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{value}"'
+
+    @cached_property
+    def _search_funcs(self) -> Dict[str, Callable[[str], List[ProcessedTicket]]]:
+        """Search method behind each tool, keyed by search type."""
+        return {
+            "jql": self._search_by_jql,
+            "text": self._search_by_text,
+            "key": self._search_by_key,
+            # A ticket ID is a key, so both tools share the direct lookup
+            "specific_id": self._search_by_key,
+            "assignee": self._search_by_assignee,
+            "reporter": self._search_by_reporter,
+            "status": self._search_by_status,
+        }
+
+    @cached_property
+    def _api_base(self) -> str:
+        """Base URL of the Jira REST API v2 used for issue and comment lookups."""
+        return self.jira_instance.rstrip("/") + "/rest/api/2"
+
+    @cached_property
+    def _search_url(self) -> str:
+        """URL of the Jira REST API v3 JQL search endpoint."""
+        return self.jira_instance.rstrip("/") + "/rest/api/3/search/jql"
+
+    @cached_property
+    def _browse_base(self) -> str:
+        """Prefix of the human-readable ticket URLs."""
+        return self.jira_instance.rstrip("/") + "/browse/"
+
+    @cached_property
+    def _auth(self) -> Tuple[str, str]:
+        """Basic-auth credentials for the Jira API."""
+        return (self.username, self.api_token)
+
+    def _get_client(self) -> httpx.Client:
+        """Return the pooled HTTP/2 client reused for every Jira request.
+
+        HTTP/2 multiplexes the concurrent requests of the worker pool over a
+        single connection to the Jira host.
+        """
+        if self._client is None:
+            with self._init_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        # The transport retries failed connection attempts; retried
+                        # statuses are handled in _send
+                        transport=httpx.HTTPTransport(
+                            http2=True,
+                            retries=_MAX_RETRIES,
+                            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                        ),
+                        auth=self._auth,
+                        headers=_BASE_HEADERS,
+                        timeout=_REQUEST_TIMEOUT,
+                    )
+        return self._client
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> Dict:
+        """Send a request to the Jira API, retrying rate-limited and transient failures."""
+        client = self._get_client()
+        deadline = time.monotonic() + _RETRY_DEADLINE
+        for attempt in range(_MAX_RETRIES + 1):
+            response = client.request(method, url, **kwargs)
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                break
+            delay = self._retry_delay(response, attempt)
+            # Give up rather than block the tool call (and pool workers) for minutes
+            if time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
+        return self._parse_response(response)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, preferring the server's Retry-After."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                # Retry-After may also be an HTTP date
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return max(delay, 0.0)
+        return _RETRY_BACKOFF * 2 ** attempt
+
     def _make_request(self, url: str, params: Dict = None) -> Dict:
         """Make an authenticated request to the Jira API."""
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        return self._send("GET", url, params=params)
 
-        response = requests.get(
-            url,
-            auth=(self.username, self.api_token),
-            headers=headers,
-            params=params
-        )
+    def _make_request_post(self, url: str, json_body: Dict) -> Dict:
+        """Make an authenticated POST request with a JSON body to the Jira API."""
+        return self._send("POST", url, content=orjson.dumps(json_body))
 
+    def _parse_response(self, response: httpx.Response) -> Dict:
+        """Check the status of a Jira API response and decode its JSON body."""
         if response.status_code != 200:
-            raise ValueError(f"Jira API request failed: {response.status_code} - {response.text}")
+            raise JiraAPIError(
+                response.status_code, f"Jira API request failed: {response.status_code} - {response.text}"
+            )
 
-        return response.json()
+        return orjson.loads(response.content)
 
-    def _get_comments(self, ticket_key: str) -> List[Dict]:
-        """Get comments for a specific ticket."""
+    def _get_search_fields(self) -> List[str]:
+        """Return the issue fields to request, including comments/attachments when enabled."""
+        fields = list(_DEFAULT_FIELDS)
+        if self.include_comments:
+            fields.append("comment")
+        if self.include_attachments:
+            fields.append("attachment")
+        return fields
+
+    def _adf_to_text(self, value: Any) -> Optional[str]:
+        """Flatten an Atlassian Document Format value (REST v3) to plain text.
+
+        Plain strings, as returned by REST v2, are passed through unchanged.
+        """
+        if not isinstance(value, dict):
+            return value
+
+        node_type = value.get("type")
+        if node_type == "text":
+            return value.get("text", "")
+        if node_type == "hardBreak":
+            return "\n"
+
+        # Leaf nodes carry their content in attrs rather than in child nodes
+        attrs = value.get("attrs") or {}
+        if node_type in ("mention", "emoji", "status"):
+            return attrs.get("text") or attrs.get("shortName") or ""
+        if node_type in ("inlineCard", "blockCard", "embedCard"):
+            return attrs.get("url") or ""
+        if node_type == "date":
+            try:
+                return datetime.fromtimestamp(int(attrs["timestamp"]) / 1000, tz=timezone.utc).date().isoformat()
+            except (KeyError, TypeError, ValueError):
+                return ""
+
+        children = [self._adf_to_text(child) for child in value.get("content", [])]
+        # Text blocks hold inline nodes; every other container holds blocks, one per line
+        separator = "" if node_type in ("paragraph", "heading", "codeBlock") else "\n"
+        return separator.join(child for child in children if child)
+
+    def _cache_get(self, cache: TTLCache, key: Hashable) -> Any:
+        """Look up a cached value; TTLCache is not thread-safe on its own."""
+        with self._cache_lock:
+            return cache.get(key)
+
+    def _cache_set(self, cache: TTLCache, key: Hashable, value: Any) -> None:
+        """Store a value in one of the response caches."""
+        with self._cache_lock:
+            cache[key] = value
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool shared by all requests of this component."""
+        if self._executor is None:
+            with self._init_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=8)
+        return self._executor
+
+    def _get_ticket_cache(self) -> TTLCache:
+        """Return the cache of direct ticket lookups."""
+        if self._ticket_cache is None:
+            with self._init_lock:
+                if self._ticket_cache is None:
+                    self._ticket_cache = TTLCache(maxsize=512, ttl=300)
+        return self._ticket_cache
+
+    def _get_jql_cache(self) -> TTLCache:
+        """Return the cache of JQL search results."""
+        if self._jql_cache is None:
+            with self._init_lock:
+                if self._jql_cache is None:
+                    # Search results go stale faster than single tickets, so keep them briefly.
+                    self._jql_cache = TTLCache(maxsize=128, ttl=60)
+        return self._jql_cache
+
+    def _get_comments(self, ticket_key: str, fields: Optional[Dict] = None) -> List[Dict]:
+        """Get comments for a specific ticket.
+
+        Uses the comments embedded in ``fields`` when they are complete and only
+        requests them separately otherwise.
+        """
         if not self.include_comments:
             return []
 
-        url = f"{self.jira_instance}/rest/api/2/issue/{ticket_key}/comment"
-        response = self._make_request(url)
+        response = (fields or {}).get("comment")
+        if not response or len(response.get("comments", [])) < response.get("total", 0):
+            url = f"{self._api_base}/issue/{ticket_key}/comment"
+            response = self._make_request(url)
 
         comments = []
         for comment in response.get("comments", []):
             comments.append({
                 "author": comment.get("author", {}).get("displayName", "Unknown"),
                 "created": comment.get("created"),
-                "body": comment.get("body")
+                "body": self._adf_to_text(comment.get("body"))
             })
 
         return comments
 
-    def _get_attachments(self, ticket_key: str) -> List[Dict]:
-        """Get attachment information for a specific ticket."""
+    def _get_attachments(self, fields: Dict) -> List[Dict]:
+        """Get attachment information from an already fetched ticket's fields."""
         if not self.include_attachments:
             return []
 
-        url = f"{self.jira_instance}/rest/api/2/issue/{ticket_key}"
-        response = self._make_request(url)
-
         attachments = []
-        for attachment in response.get("fields", {}).get("attachment", []):
+        for attachment in fields.get("attachment") or []:
             attachments.append({
                 "filename": attachment.get("filename"),
                 "size": attachment.get("size"),
@@ -172,156 +553,83 @@ class JiraSearchTicketComponent(LCToolComponent):
 
         return attachments
 
-    def _process_ticket(self, ticket: Dict) -> Dict:
+    def _process_ticket(self, ticket: Dict) -> ProcessedTicket:
         """Process a ticket to extract relevant information."""
         ticket_key = ticket.get("key")
         fields = ticket.get("fields", {})
 
-        processed_ticket = {
-            "key": ticket_key,
-            "summary": fields.get("summary"),
-            "description": fields.get("description"),
-            "status": fields.get("status", {}).get("name"),
-            "priority": fields.get("priority", {}).get("name"),
-            "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else "Unassigned",
-            "reporter": fields.get("reporter", {}).get("displayName") if fields.get("reporter") else "Unknown",
-            "created": fields.get("created"),
-            "updated": fields.get("updated"),
-            "url": f"{self.jira_instance}/browse/{ticket_key}"
-        }
-
-        if self.include_comments:
-            processed_ticket["comments"] = self._get_comments(ticket_key)
-
-        if self.include_attachments:
-            processed_ticket["attachments"] = self._get_attachments(ticket_key)
-
-        return processed_ticket
-
-    def _process_search_results(self, issues: List[Dict]) -> List[Dict]:
-        """Process search results to extract relevant information."""
-        processed_results = []
-
-        for issue in issues:
-            processed_results.append(self._process_ticket(issue))
-
-        return processed_results
+        # Look each nested field up once; Jira sends null for unset ones
+        status = fields.get("status") or {}
+        priority = fields.get("priority") or {}
+        assignee = fields.get("assignee")
+        reporter = fields.get("reporter")
+
+        return ProcessedTicket(
+            key=ticket_key,
+            summary=fields.get("summary"),
+            description=self._adf_to_text(fields.get("description")),
+            status=status.get("name"),
+            priority=priority.get("name"),
+            assignee=assignee.get("displayName") if assignee else "Unassigned",
+            reporter=reporter.get("displayName") if reporter else "Unknown",
+            created=fields.get("created"),
+            updated=fields.get("updated"),
+            url=f"{self._browse_base}{ticket_key}",
+            comments=tuple(self._get_comments(ticket_key, fields)),
+            attachments=tuple(self._get_attachments(fields)),
+        )
 
-    def _format_search_results(self, results: List[Dict]) -> str:
+    def _format_search_results(self, results: List[ProcessedTicket]) -> str:
         """Format search results as a readable string."""
         if not results:
             return "No tickets found."
 
+        include_comments = self.include_comments
+        include_attachments = self.include_attachments
+
+        # One entry per ticket, joined once at the end
         formatted_results = []
+        append = formatted_results.append
 
         for ticket in results:
-            ticket_info = [
-                f"Key: {ticket['key']}",
-                f"Summary: {ticket['summary']}",
-                f"Status: {ticket['status']}",
-                f"Assignee: {ticket['assignee']}",
-                f"Reporter: {ticket['reporter']}",
-                f"URL: {ticket['url']}"
-            ]
-
-            if self.include_comments and ticket.get("comments"):
-                comments_info = ["Comments:"]
-                for comment in ticket["comments"]:
-                    comments_info.append(f"  - {comment['author']} ({comment['created']}): {comment['body'][:100]}...")
-                ticket_info.append("\n".join(comments_info))
-
-            if self.include_attachments and ticket.get("attachments"):
-                attachments_info = ["Attachments:"]
-                for attachment in ticket["attachments"]:
-                    attachments_info.append(f"  - {attachment['filename']} ({attachment['size']} bytes)")
-                ticket_info.append("\n".join(attachments_info))
-
-            formatted_results.append("\n".join(ticket_info))
-
-        return "\n\n".join(formatted_results)
-
-    def build_tool(self) -> Sequence[Tool]:
-        """Build and return Jira search tools based on selected search type."""
-        tools = []
-
-        if self.search_type in ["jql", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_JQL",
-                    description="Search Jira tickets using JQL (Jira Query Language). Input should be a valid JQL query string.",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_jql(input_str.strip())
-                    ),
-                )
-            )
-
-        if self.search_type in ["text", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_Text",
-                    description="Search Jira tickets containing specific text. Input should be the text to search for.",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_text(input_str.strip())
-                    ),
-                )
+            ticket_info = (
+                f"Key: {ticket.key}\n"
+                f"Summary: {ticket.summary}\n"
+                f"Status: {ticket.status}\n"
+                f"Assignee: {ticket.assignee}\n"
+                f"Reporter: {ticket.reporter}\n"
+                f"URL: {ticket.url}"
             )
 
-        if self.search_type in ["key", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_Key",
-                    description="Search for a specific Jira ticket by its key (e.g., PROJECT-123).",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_key(input_str.strip())
-                    ),
+            comments = include_comments and ticket.comments
+            if comments:
+                ticket_info += "\nComments:\n" + "\n".join(
+                    f"  - {comment['author']} ({comment['created']}): {comment['body'][:100]}..."
+                    for comment in comments
                 )
-            )
 
-        if self.search_type in ["specific_id", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_Specific_ID",
-                    description="Search for a specific Jira ticket by its ID (e.g., OAPI-10686).",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_specific_id(input_str.strip())
-                    ),
+            attachments = include_attachments and ticket.attachments
+            if attachments:
+                ticket_info += "\nAttachments:\n" + "\n".join(
+                    f"  - {attachment['filename']} ({attachment['size']} bytes)"
+                    for attachment in attachments
                 )
-            )
 
-        if self.search_type in ["assignee", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_Assignee",
-                    description="Search Jira tickets assigned to a specific user. Input should be the username or email.",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_assignee(input_str.strip())
-                    ),
-                )
-            )
+            append(ticket_info)
 
-        if self.search_type in ["reporter", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_Reporter",
-                    description="Search Jira tickets reported by a specific user. Input should be the username or email.",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_reporter(input_str.strip())
-                    ),
-                )
-            )
+        return "\n\n".join(formatted_results)
 
-        if self.search_type in ["status", "all"]:
-            tools.append(
-                Tool(
-                    name="Jira_Search_Status",
-                    description="Search Jira tickets with a specific status. Input should be the status name (e.g., 'In Progress', 'Done').",
-                    func=lambda input_str: self._format_search_results(
-                        self._search_by_status(input_str.strip())
-                    ),
-                )
-            )
+    def _run_tool(self, search_type: str, input_str: str) -> str:
+        """Run the search behind a tool and format its results for the agent."""
+        return self._format_search_results(self._search_funcs[search_type](input_str.strip()))
 
-        return tools
+    def build_tool(self) -> Sequence[Tool]:
+        """Build and return Jira search tools based on selected search type."""
+        return [
+            Tool(name=name, description=description, func=partial(self._run_tool, search_type))
+            for search_type, name, description in _TOOL_SPECS
+            if self.search_type in (search_type, "all")
+        ]
 
     def update_build_config(self, build_config: dict, field_value: Any, field_name: str | None = None) -> dict:
         """Update build configuration based on field changes."""